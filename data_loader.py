@@ -8,15 +8,19 @@ Some datasets were found online, and some of them were generated by us (mainly u
 Translate/Maps/Geocode/Search APIs) and then manually cleaned and inspected.
 """
 import csv
+import json
 import math
+import operator
+import os.path
 from dataclasses import dataclass
+from functools import lru_cache
 
 from districts import District
 from graphs import Graph, WeightedGraph
 from userdata import User
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UserPreferenceDogBreed:
     """A class of dog breed that stores information about each breed that stores the dog's rating
     of each trait based off of the data collected by the american Kennel Club:
@@ -36,6 +40,16 @@ class UserPreferenceDogBreed:
     stimulation_needs: int  # Let users decide
 
 
+@lru_cache(maxsize=512)
+def normalize_breed_name(raw_dog_breed: str) -> str:
+    """Returns the capitalized form of a raw breed name from the dog data.
+
+    There are only a few hundred distinct breeds across thousands of rows, so this is cached:
+    each breed is capitalized once and every row shares the same string object for it.
+    """
+    return raw_dog_breed.capitalize()
+
+
 def load_dog_data(dog_data_file: str, districts: set[District]) -> tuple[Graph, WeightedGraph]:
     """Creates two graphs:
         - a graph containing every user in the given dog data file,
@@ -44,42 +58,43 @@ def load_dog_data(dog_data_file: str, districts: set[District]) -> tuple[Graph,
             and every dog breed with weighted edges between districts and # of dogs from breed
 
     Ignores Mischling/mixed-breed dogs.
+    Owners, dog breeds and districts are added as vertices of kind 'user', 'breed' and 'district'.
     """
     dog_graph = Graph()
     district_graph = WeightedGraph()
     district_mapping = {target.district_id: target for target in districts}
     users = {}
+    seen_breeds = set()
     with open(dog_data_file, encoding='utf-8') as dog_data_content:
         reader = csv.reader(dog_data_content)
         next(reader, None)  # Skip the first line header
-        for row in reader:
-            user_id = int(row[0])
-            raw_age_range = row[1]
-            if not raw_age_range.strip():
-                continue  # Missing age range
-            gender = row[2].upper()
-            if not gender.strip():
-                continue  # Missing gender data
-            district_id = int(row[4])
-            if district_id not in district_mapping:
+        for raw_user_id, raw_age_range, raw_gender, raw_district_id, raw_dog_breed in map(
+                operator.itemgetter(0, 1, 2, 4, 5), reader):
+            # Cheapest checks first, so skipped rows never pay for parsing
+            if not raw_age_range.strip() or not raw_gender.strip() or not raw_district_id:
+                continue  # Missing age range, gender or district data
+            district = district_mapping.get(int(raw_district_id))
+            if district is None:
                 continue  # Invalid district ID
-            district = district_mapping[district_id]
-            dog_breed = row[5].capitalize()
+            dog_breed = normalize_breed_name(raw_dog_breed)
             if 'Mischling' in dog_breed:  # Ignore mix-breed dogs because its complicated
                 continue
-            split_age_range = raw_age_range.split('-')
-            age = (int(split_age_range[0]) + int(split_age_range[1])) // 2  # Average in age range
-            if user_id not in district_mapping:
-                users[user_id] = User(user_id, age, gender, district)
-                dog_graph.add_vertex(users[user_id])
-            user = users[user_id]
-            dog_graph.add_vertex(dog_breed)
+            user_id = int(raw_user_id)
+            user = users.get(user_id)
+            if user is None:  # Age and gender are only needed the first time we see an owner
+                split_age_range = raw_age_range.split('-')
+                age = (int(split_age_range[0]) + int(split_age_range[1])) // 2  # Average in age range
+                user = User(user_id, age, raw_gender.upper(), district)
+                users[user_id] = user
+                dog_graph.add_vertex(user, 'user')
+            if dog_breed not in seen_breeds:  # Breeds repeat on most rows, only add their vertices once
+                seen_breeds.add(dog_breed)
+                dog_graph.add_vertex(dog_breed, 'breed')
+                district_graph.add_vertex(dog_breed, 'breed')
             dog_graph.add_edge(dog_breed, user)
 
             if not district_graph.contains(user.district):
-                district_graph.add_vertex(user.district)
-            if not district_graph.contains(dog_breed):
-                district_graph.add_vertex(dog_breed)
+                district_graph.add_vertex(user.district, 'district')
             current_weight = district_graph.get_weight(user.district, dog_breed)
             district_graph.add_edge(user.district, dog_breed, current_weight + 1)
     return dog_graph, district_graph
@@ -138,25 +153,21 @@ def normalize_district_distances(raw_district_distances: dict[District, dict[Dis
     In this case, also flips the values so that 1.0 indicates close districts and 0.0 is far.
     Mutates the given dictionary.
     """
+    entries = []
     min_distance = math.inf
     max_distance = 0
-    for origin in raw_district_distances:
-        for destination in raw_district_distances[origin]:
-            assert origin != destination
-            distance = raw_district_distances[origin][destination]
-            min_distance = min(distance, min_distance)
-            max_distance = max(distance, max_distance)
+    for destinations in raw_district_distances.values():  # Single walk over the nested dicts
+        for destination, distance in destinations.items():
+            entries.append((destinations, destination, distance))
+            if distance < min_distance:
+                min_distance = distance
+            if distance > max_distance:
+                max_distance = distance
     if max_distance == 0:
         raise ValueError
     difference = max_distance - min_distance
-    for origin in raw_district_distances:
-        for destination in raw_district_distances[origin]:
-            distance = raw_district_distances[origin][destination]
-            distance -= min_distance
-            distance /= difference
-            distance = 1 - distance
-            raw_district_distances[origin][destination] = distance
-            assert 0.0 <= distance <= 1.0
+    for destinations, destination, distance in entries:
+        destinations[destination] = 1 - (distance - min_distance) / difference
 
 
 def apply_district_distances(district_distances: dict[District, dict[District, float]]) -> None:
@@ -172,14 +183,12 @@ def apply_district_distances(district_distances: dict[District, dict[District, f
 def dog_breed_data_loader(file: str) -> list[UserPreferenceDogBreed]:
     """Loads the data from the breed_traits.csv file, creates a list of DogBreed objects"""
     with open(file) as dog_breed_file:
-        dog_breed_file.readline()
-        breed_informations = []
         dog_breed_rows = csv.reader(dog_breed_file)
+        next(dog_breed_rows, None)
+        breed_informations = []
         for row in dog_breed_rows:
-            breed_informations.append(
-                UserPreferenceDogBreed(row[0], int(row[1]), int(row[2]), int(row[3]), int(row[4]), int(row[5]),
-                                       int(row[6]), int(row[7]), int(row[8]), int(row[9]), int(row[10]),
-                                       int(row[11]), int(row[12])))
+            # Columns 1 to 12 are the trait ratings, in the same order as the dataclass fields
+            breed_informations.append(UserPreferenceDogBreed(row[0], *map(int, row[1:13])))
         return breed_informations
 
 
@@ -188,8 +197,8 @@ def load_district_lat_lng(file: str, districts: set[District]) -> dict[District,
     """
     district_lookup = {target.district_name: target for target in districts}
     with open(file, encoding='utf-8') as district_file:
-        district_file.readline()
         district_rows = csv.reader(district_file)
+        next(district_rows, None)
         district_dict = {}
         for row in district_rows:
             district_name, lat, lng = row[0], float(row[1]), float(row[2])
@@ -202,8 +211,8 @@ def load_translation_mapping(file: str) -> dict[str, str]:
     """Loads the mapping between german dog names to english dog names from a file.
     """
     with open(file, encoding='utf-8') as translation_file:
-        translation_file.readline()
         translation_rows = csv.reader(translation_file)
+        next(translation_rows, None)
         translation_dict = {}
         for row in translation_rows:
             translation_dict[row[0]] = row[1]  # German to english
@@ -214,9 +223,27 @@ def load_dog_images(file: str) -> dict[str, str]:
     """Loads the mapping between ENGLISH dog names and images URLs online.
     """
     with open(file) as images_file:
-        images_file.readline()
         images_rows = csv.reader(images_file)
+        next(images_rows, None)
         images_dict = {}
         for row in images_rows:
             images_dict[row[0]] = row[1]
         return images_dict
+
+
+def load_json_cache(cache_path: str) -> dict:
+    """Loads previously fetched API results from the JSON cache file at cache_path.
+
+    Returns an empty cache if the file does not exist yet.
+    """
+    if not os.path.isfile(cache_path):
+        return {}
+    with open(cache_path, encoding='utf-8') as cache_file:
+        return json.load(cache_file)
+
+
+def save_json_cache(cache_path: str, cache: dict) -> None:
+    """Writes a cache of API results to the JSON file at cache_path, overwriting it.
+    """
+    with open(cache_path, 'w', encoding='utf-8') as cache_file:
+        json.dump(cache, cache_file)
@@ -6,36 +6,59 @@ between districts in a CSV file.
 Data was manually inspected after generation since sometimes the API fails.
 """
 import os.path
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter, Retry
 
 from districts import District
 import data_loader
 
+# Reuses connections to the Maps API across requests
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=32, pool_maxsize=32,
+                                       max_retries=Retry(total=3, backoff_factor=0.2)))
 
-def load_district_distance(api_key: str, origin: District, destination: District) -> float:
-    """Uses the Google Maps API to load the distance between two districts (in kilometers of driving).
 
+def load_district_distance_matrix(api_key: str,
+                                  origins: list[District],
+                                  destinations: list[District]) -> dict[tuple[District, District], float]:
+    """Uses the Google Maps API to load the distances between every origin and every destination district
+    (in kilometers of driving) with a single request.
+
+    Returns a mapping from (origin, destination) to distance, skipping pairs where origin == destination.
+    Pairs whose distance could not be loaded (including when the whole request fails) get a negative distance.
     Must provide a valid GCP API key for using Maps.
-    Should be called asynchronously (awaits endpoint response).
+    The API accepts at most 100 origin-destination elements per request (e.g. 10 x 10).
     """
-    print(f'{origin.district_name}, {destination.district_name}')
+    origin_names = '|'.join(f'{origin.district_name}%2C+Zurich' for origin in origins)
+    destination_names = '|'.join(f'{destination.district_name}%2C+Zurich' for destination in destinations)
     endpoint_url = (f'https://maps.googleapis.com/maps/api/distancematrix/json'
-                    f'?destinations={destination.district_name}%2C+Zurich'
-                    f'&origins={origin.district_name}%2C+Zurich'
+                    f'?destinations={destination_names}'
+                    f'&origins={origin_names}'
                     f'&units=metric'
                     f'&key={api_key}')
     print(endpoint_url)
-    response = requests.get(endpoint_url)
-    print(response.json())
     try:
-        distance = float(response.json()['rows'][0]['elements'][0]['distance']['text'][:-3])
-    except (KeyError, ValueError):
-        distance = -9999999999
-
-    return distance
+        response = _SESSION.get(endpoint_url, timeout=10).json()
+    except requests.RequestException:
+        response = {}  # Every pair in this tile fails below, and is requested again on the next run
+    distances = {}
+    for i, origin in enumerate(origins):
+        for j, destination in enumerate(destinations):
+            if origin == destination:
+                continue
+            try:
+                # 'value' is always an integer number of meters, unlike the localized 'text' ("1.2 km")
+                distance = response['rows'][i]['elements'][j]['distance']['value'] / 1000
+            except (KeyError, IndexError, TypeError):
+                distance = -9999999999
+            distances[(origin, destination)] = distance
+    return distances
 
 
-def create_distance_csv(api_key: str, csv_path: str, districts: set[District]) -> None:
+def create_distance_csv(api_key: str, csv_path: str, districts: set[District],
+                        max_workers: int = 32, tile_size: int = 10,
+                        cache_path: str = 'distances_cache.json') -> None:
     """Creates a CSV file at the given path that will contain one row for each district,
     and then on each row a mapping between district IDs and distance to each district.
 
@@ -43,22 +66,42 @@ def create_distance_csv(api_key: str, csv_path: str, districts: set[District]) -
     Where 100 is the district ID, 123 and 456 are district IDs of close districts,
     and 1.1 and 2.5 are distances to these districts.
 
-    This makes len(destinations) ** 2 API calls, use it wisely.
+    Districts are split into tiles of tile_size, and each (origin tile, destination tile) pair is one
+    API call, so this makes ceil(len(districts) / tile_size) ** 2 API calls, use it wisely.
+    Calls are spread across max_workers threads.
+    Successful distances are stored in the JSON file at cache_path, keyed like '11->12' (origin district ID
+    -> destination district ID), and tiles that are fully cached are not requested again on later runs.
 
     The csv_path file must not already exist.
     """
     if os.path.isfile(csv_path):
         raise FileExistsError  # File must not exist!
+    district_list = list(districts)
+    tiles = [district_list[i:i + tile_size] for i in range(0, len(district_list), tile_size)]
+    tile_pairs = [(origins, destinations) for origins in tiles for destinations in tiles]
+    cache = data_loader.load_json_cache(cache_path)
+    uncached_tile_pairs = [
+        (origins, destinations) for origins, destinations in tile_pairs
+        if any(f'{origin.district_id}->{destination.district_id}' not in cache
+               for origin in origins for destination in destinations if origin != destination)
+    ]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        tile_distances = list(executor.map(lambda pair: load_district_distance_matrix(api_key, *pair),
+                                           uncached_tile_pairs))
+    distances = {(origin, destination): cache[f'{origin.district_id}->{destination.district_id}']
+                 for origin in district_list for destination in district_list
+                 if f'{origin.district_id}->{destination.district_id}' in cache}
+    for tile in tile_distances:
+        distances.update(tile)
+        for (origin, destination), distance in tile.items():
+            if distance >= 0:  # Don't cache failed lookups so they are retried next time
+                cache[f'{origin.district_id}->{destination.district_id}'] = distance
+    data_loader.save_json_cache(cache_path, cache)
     with open(csv_path, 'w') as csv_file:
         csv_file.write('district_id,district_distances\n')  # header
-        for origin in districts:
-            district_distances = ''
-            for destination in districts:
-                if origin == destination:
-                    continue
-                distance = load_district_distance(api_key, origin, destination)
-                district_distances += f'{destination.district_id}:{distance}|'
-            district_distances = district_distances[:-1]  # Remove last |
+        for origin in district_list:
+            district_distances = '|'.join(f'{destination.district_id}:{distances[(origin, destination)]}'
+                                          for destination in district_list if origin != destination)
             csv_file.write(f'{origin.district_id},{district_distances}\n')
 
 
@@ -6,11 +6,11 @@ Does not handle processing of data, just holds it.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class District:
     """Represents a district in Zurich.
 
@@ -22,10 +22,10 @@ class District:
     """
     district_id: int
     district_name: str
-    __district_distances: Optional[dict[District, float]] = None
+    __district_distances: Optional[dict[District, float]] = field(default=None, compare=False, repr=False)
 
     def __hash__(self) -> int:
-        return hash(str(self.district_id))
+        return hash(self.district_id)
 
     def get_distance(self, other: District) -> float:
         """Gets the cached distance from this district to another on a scale from 0.0 to 1.0.
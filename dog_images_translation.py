@@ -5,52 +5,189 @@ Creates CSV data on translation of dog breed names from German to English, and
 finds links to images of different dog breeds for displaying to the user.
 """
 import csv
-import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
 import requests
+from requests.adapters import HTTPAdapter, Retry
 
 from googletrans import Translator
 
+import data_loader
 
-def dog_breed_names_csv_writer(dog_data_file: str, new_file_path: str) -> None:
+# Reuses connections to the Custom Search API across searches
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=20, pool_maxsize=20,
+                                       max_retries=Retry(total=3, backoff_factor=0.5,
+                                                         status_forcelist=[429, 500, 502, 503, 504],
+                                                         raise_on_status=False)))
+
+# Cached translations and image URLs older than this are fetched again
+CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
+# Write buffer for generated CSV files, so rows reach the disk in a few large writes
+CSV_BUFFER_SIZE = 1 << 20  # 1 MiB
+
+
+class RateLimiter:
+    """A thread-safe token bucket that limits how often requests are sent to a service.
+
+    Up to capacity requests can be sent at once, after which requests are let through at rate per second.
+
+    Instance Attributes:
+        - rate: The number of tokens added to the bucket per second
+        - capacity: The maximum number of tokens the bucket can hold
+
+    Representation Invariants:
+        - self.rate > 0
+        - self.capacity >= 1
+    """
+    rate: float
+    capacity: float
+    _tokens: float
+    _last_refill: float
+    _lock: threading.Lock
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """Initialize a new rate limiter with a full bucket."""
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Blocks until a token is available, then takes it.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def get_or_fetch(cache: dict[str, list], key: str, fetcher: Callable[[], Optional[str]]) -> Optional[str]:
+    """Returns the cached value for key if it is younger than CACHE_TTL_SECONDS,
+    otherwise calls fetcher and caches its result.
+
+    Keys name the lookup, e.g. 'de-en:Dackel' or 'img:Dachshund', and map to [value, timestamp] pairs.
+    Failed fetches (None) are not cached so that they are retried next time.
+    """
+    entry = cache.get(key)
+    if entry is not None and entry[1] >= time.time() - CACHE_TTL_SECONDS:
+        return entry[0]
+    value = fetcher()
+    if value is not None:
+        cache[key] = [value, time.time()]
+    return value
+
+
+def translate_breed_name(translator: Translator, breed: str, limiter: Optional[RateLimiter] = None) -> Optional[str]:
+    """Translates a German dog breed name to a capitalized English name using Google Translate.
+
+    If a limiter is given, waits for it before sending the request.
+    Returns None if the translation failed.
+    """
+    if limiter is not None:
+        limiter.acquire()
+    try:
+        translated = translator.translate(text=breed, src='de', dest='en')
+    except (AttributeError, TimeoutError):
+        return None
+    return translated.text.capitalize()
+
+
+def dog_breed_names_csv_writer(dog_data_file: str, new_file_path: str, max_workers: int = 16,
+                               cache_path: str = 'lookup_cache.json', verbose: bool = False,
+                               translations_per_minute: Optional[int] = None) -> None:
     """Creates a csv file in the format
     <German Dog Breed Name>,<English Dog Breed Name>
 
+    Translations are requested on max_workers threads.
+    Google Translate blocks clients that send too many requests, so if translations_per_minute is given,
+    at most that many are sent per minute (after an initial burst of that many). By default they are not limited.
+    Translations are cached in the JSON file at cache_path, so re-runs only translate new breeds.
+    If verbose is True, each written row is printed.
+
     Representation Invariants:
     - dog_data_file: must be in the data folder
     """
     translator = Translator()
+    limiter = None
+    if translations_per_minute is not None:
+        limiter = RateLimiter(translations_per_minute / 60, translations_per_minute)
     dog_breeds = set()
 
     with open(dog_data_file) as dog_data_content:
         reader = csv.reader(dog_data_content)
         next(reader, None)  # Skip the first line header
-        i = 0
         for row in reader:
-            if 'Mischling' == row[5].capitalize():  # Ignore mix-breed dogs because its complicated
-                continue
-            else:
-                dog_breed = row[5].capitalize()
-                print(i)
-                i += 1
+            dog_breed = data_loader.normalize_breed_name(row[5])  # Only the breed column is used
+            if dog_breed != 'Mischling':  # Ignore mix-breed dogs because its complicated
                 dog_breeds.add(dog_breed)
 
-    with open(new_file_path, 'w') as new_file:
+    breeds = list(dog_breeds)
+    cache = data_loader.load_json_cache(cache_path)
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            translations = list(executor.map(
+                lambda breed: get_or_fetch(cache, f'de-en:{breed}',
+                                           lambda: translate_breed_name(translator, breed, limiter)),
+                breeds
+            ))
+    finally:
+        data_loader.save_json_cache(cache_path, cache)  # Keep what was fetched even if a lookup failed
+
+    rows = [(breed, translation) for breed, translation in zip(breeds, translations) if translation is not None]
+    if verbose:
+        for breed, translation in rows:
+            print(f'row added: {breed}, {translation}')
+    with open(new_file_path, 'w', newline='', buffering=CSV_BUFFER_SIZE) as new_file:
         csv_writer = csv.writer(new_file)
         csv_writer.writerow(['German Dog Breed Name', 'English Dog Breed Name'])
-        print('here')
-        for breed in dog_breeds:
-            try:
-                translated = translator.translate(text=breed, src='de', dest='en')
-            except (AttributeError, TimeoutError):
-                continue
-            csv_writer.writerow([breed, translated.text.capitalize()])
-            print('row added')
+        csv_writer.writerows(rows)
+
 
+def search_dog_image(breed: str, api: str, cse: str, limiter: Optional[RateLimiter] = None) -> Optional[str]:
+    """Uses the Google Custom Search API to find the URL of the first image result for a dog breed.
 
-def create_dog_image_csv(dog_names_file: str, new_file_path: str, api: str, cse: str) -> None:
+    If a limiter is given, waits for it before sending the request.
+    Returns None if the search failed or had no results.
+    """
+    if limiter is not None:
+        limiter.acquire()
+    try:
+        # Only the first result's link is used, so only that is requested
+        response = _SESSION.get('https://www.googleapis.com/customsearch/v1',
+                                params={'key': api, 'cx': cse, 'searchType': 'image', 'q': breed,
+                                        'num': 1, 'fields': 'items(link)'},
+                                timeout=10)
+        data = response.json()
+    except requests.RequestException:
+        return None
+
+    if 'items' in data:
+        # Get Url of the first image
+        return data['items'][0]['link']
+    return None
+
+
+def create_dog_image_csv(dog_names_file: str, new_file_path: str, api: str, cse: str, max_workers: int = 10,
+                         cache_path: str = 'lookup_cache.json', verbose: bool = False,
+                         searches_per_second: int = 10) -> None:
     """A method that creates a new csv document based on the dog_file and
         creates the new file using new_file_path
 
+    Searches are requested on max_workers threads, and at most searches_per_second are sent per second
+    to stay within the API's query limit.
+    Image URLs are cached in the JSON file at cache_path, so re-runs only search for new breeds.
+    If verbose is True, breeds without an image are printed along with their row number.
+
     Representation Invariants:
     - dog_names_file: must be in the data folder
     - new_file_path: must be a path that creates a file in the data folder
@@ -59,53 +196,54 @@ def create_dog_image_csv(dog_names_file: str, new_file_path: str, api: str, cse:
     """
     dog_names = []
     with open(dog_names_file) as file:
-        file.readline()  # skips the first line
         reader = csv.reader(file)
+        next(reader, None)  # skips the first line
         for row in reader:
             dog_names.append(row[1])
 
-    with open(new_file_path, 'w') as file:
+    unique_dog_names = list(dict.fromkeys(dog_names))  # Search each breed once, even if it is listed twice
+    limiter = RateLimiter(searches_per_second, searches_per_second)
+    cache = data_loader.load_json_cache(cache_path)
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            image_urls = dict(zip(unique_dog_names, executor.map(
+                lambda breed: get_or_fetch(cache, f'img:{breed}',
+                                           lambda: search_dog_image(breed, api, cse, limiter)),
+                unique_dog_names
+            )))
+    finally:
+        data_loader.save_json_cache(cache_path, cache)  # Keep what was fetched even if a lookup failed
+
+    rows = []
+    for count, breed in enumerate(dog_names, start=2):
+        image_url = image_urls[breed]
+        if image_url is not None:
+            rows.append((breed, image_url))
+        elif verbose:
+            print(f'{breed}, {count}')
+    with open(new_file_path, 'w', newline='', buffering=CSV_BUFFER_SIZE) as file:
         writer = csv.writer(file)
         writer.writerow(['dog_name', 'image_url'])
-        count = 2
-        for breed in dog_names:
-            url = (f"https://www.googleapis.com/customsearch/v1?"
-                   f"key={api}&"
-                   f"cx={cse}&"
-                   f"searchType=image&"
-                   f"q={breed}")
-            response = requests.get(url)
-            data = json.loads(response.text)
-
-            if 'items' in data:
-                # Get Url of the first image
-                image_url = data['items'][0]['link']
-                writer.writerow([breed, image_url])
-                count += 1
-            else:
-                print(f'{breed}, {count}')
-                count += 1
-                continue
-
-
-def data_cleaning(file1: str, file2: str, unduplicated: str) -> None:
+        writer.writerows(rows)
+
+
+def data_cleaning(file1: str, file2: str, unduplicated: str, verbose: bool = False) -> None:
     """A function that ignores the duplicated rows from the second file compared to file1 and creates a
     new file without the duplicates.
+
+    If verbose is True, the key of each kept row is printed.
     """
-    dog_breeds = set()
-    with open(file1) as file1_content:
-        reader = csv.reader(file1_content)
-        for row in reader:
-            dog_breeds.add(row[0])
-
-    with open(unduplicated, 'w') as unduplicated_content:
-        writer = csv.writer(unduplicated_content)
-        with open(file2) as file2_content:
-            reader = csv.reader(file2_content)
-            for row in reader:
-                if row[0] not in dog_breeds:
-                    print(row[0])
-                    writer.writerow(row)
+    with open(file1, newline='', buffering=CSV_BUFFER_SIZE) as file1_content:
+        dog_breeds = frozenset(row[0] for row in csv.reader(file1_content))
+
+    with open(file2, newline='', buffering=CSV_BUFFER_SIZE) as file2_content:
+        unduplicated_rows = [row for row in csv.reader(file2_content) if row[0] not in dog_breeds]
+
+    if verbose:
+        for row in unduplicated_rows:
+            print(row[0])
+    with open(unduplicated, 'w', newline='', buffering=CSV_BUFFER_SIZE) as unduplicated_content:
+        csv.writer(unduplicated_content).writerows(unduplicated_rows)
 
 
 if __name__ == '__main__':
@@ -14,23 +14,25 @@ class _Vertex:
 
     Instance Attributes:
         - element: The data stored in this vertex
+        - kind: The type of element this vertex represents (e.g. 'user' or 'breed'), or '' if not given
+        - neighbours: The vertices that are adjacent to this vertex
 
     Representation Invariants:
         - self not in self.neighbours
         - all(self in target.neighbours for target in self.neighbours)
     """
+    __slots__ = ('element', 'kind', 'neighbours')
     element: Any
+    kind: str
     neighbours: set[_Vertex]
 
-    def __init__(self, element: Any) -> None:
-        """Initialize a new vertex with the given element.
+    def __init__(self, element: Any, kind: str = '') -> None:
+        """Initialize a new vertex with the given element and kind.
 
         This vertex is initialized with no neighbours.
-
-        Preconditions:
-            - kind in {'user', 'book'}
         """
         self.element = element
+        self.kind = kind
         self.neighbours = set()
 
     def degree(self) -> int:
@@ -41,20 +43,26 @@ class _Vertex:
 class Graph:
     """A graph with connected vertices.
     """
+    # Private Instance Attributes:
+    #     - _vertices: A mapping from each item in this graph to its vertex
+    #     - _items_by_kind: The items in this graph grouped by the kind of their vertex
     _vertices: dict[Any, _Vertex]
+    _items_by_kind: dict[str, set]
 
     def __init__(self) -> None:
         """Initialize an empty graph (no vertices or edges)."""
         self._vertices = {}
+        self._items_by_kind = {}
 
-    def add_vertex(self, item: Any) -> None:
-        """Add a vertex with the given item to this graph.
+    def add_vertex(self, item: Any, kind: str = '') -> None:
+        """Add a vertex with the given item and kind to this graph.
 
         The new vertex is not adjacent to any other vertices.
         Do nothing if the given item is already in this graph.
         """
         if item not in self._vertices:
-            self._vertices[item] = _Vertex(item)
+            self._vertices[item] = _Vertex(item, kind)
+            self._items_by_kind.setdefault(kind, set()).add(item)
 
     def add_edge(self, item1: Any, item2: Any) -> None:
         """Add an edge between the two vertices with the given items in this graph.
@@ -92,8 +100,7 @@ class Graph:
         True
         """
         if item1 in self._vertices and item2 in self._vertices:
-            v1 = self._vertices[item1]
-            return any(v2.element == item2 for v2 in v1.neighbours)
+            return self._vertices[item2] in self._vertices[item1].neighbours
         else:
             return False
 
@@ -117,10 +124,22 @@ class Graph:
         else:
             raise ValueError
 
-    def get_all_nodes(self) -> set:
+    def get_all_nodes(self, kind: str = '') -> set:
         """Return a set of all the node values in this graph.
+
+        If kind is given, only return the node values whose vertices have that kind.
+        >>> g = Graph()
+        >>> g.add_vertex(1, 'odd')
+        >>> g.add_vertex(2, 'even')
+        >>> g.add_vertex(3, 'odd')
+        >>> g.get_all_nodes('odd') == {1, 3}
+        True
+        >>> g.get_all_nodes() == {1, 2, 3}
+        True
         """
-        return set(self._vertices.keys())
+        if kind == '':
+            return set(self._vertices.keys())
+        return set(self._items_by_kind.get(kind, ()))
 
     def contains(self, element: Any) -> bool:
         """Checks if this graph contains a vertex with the given key.
@@ -143,16 +162,17 @@ class _WeightedVertex(_Vertex):
         - self not in self.neighbours
         - all(self in u.neighbours for u in self.neighbours)
     """
+    __slots__ = ()
     element: Any
     kind: str
     neighbours: dict[_WeightedVertex, int | float]
 
-    def __init__(self, item: Any) -> None:
-        """Initialize a new vertex with the given item.
+    def __init__(self, item: Any, kind: str = '') -> None:
+        """Initialize a new vertex with the given item and kind.
 
         This vertex is initialized with no neighbours.
         """
-        super().__init__(item)
+        super().__init__(item, kind)
         self.neighbours = {}
 
 
@@ -161,19 +181,15 @@ class WeightedGraph(Graph):
     """
     _vertices: dict[Any, _WeightedVertex]
 
-    def __init__(self) -> None:
-        """Initialize an empty graph (no vertices or edges)."""
-        self._vertices = {}
-        Graph.__init__(self)
-
-    def add_vertex(self, item: Any) -> None:
-        """Add a vertex with the given item.
+    def add_vertex(self, item: Any, kind: str = '') -> None:
+        """Add a vertex with the given item and kind.
 
         The new vertex is not adjacent to any other vertices.
         Do nothing if the given item is already in this graph.
         """
         if item not in self._vertices:
-            self._vertices[item] = _WeightedVertex(item)
+            self._vertices[item] = _WeightedVertex(item, kind)
+            self._items_by_kind.setdefault(kind, set()).add(item)
 
     def add_edge(self, item1: Any, item2: Any, weight: int | float = 1) -> None:
         """Add an edge between the two vertices with the given items in this graph,
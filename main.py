@@ -10,23 +10,147 @@ Utilizes TKinter for UI elements, and OOP for questions and such.
 Contains a lot more logic for displaying popups, post-processing data,
 loading images, etc.
 """
+import hashlib
 import io
 import math
+import operator
+import os
+import threading
 import tkinter as tk
-import urllib.request
+import tkinter.font as tkfont
+import warnings
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Callable, Optional
-from urllib.error import HTTPError
-import ssl
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import InsecureRequestWarning
 from PIL import Image, ImageTk
-from PIL.ImageTk import PhotoImage
 
 import data_loader
 import user_demographics
 import user_preference
 import zurich_map
 from userdata import User
-from districts import District
+
+# Breed images are downloaded on these threads so that the TK event loop never waits on the network
+_IMAGE_POOL = ThreadPoolExecutor(max_workers=4)
+# Reuses connections to image hosts across downloads
+_IMAGE_SESSION = requests.Session()
+_IMAGE_SESSION.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=4))
+# Image links point at many arbitrary hosts, so certificates are not verified (as before with urllib)
+_IMAGE_SESSION.verify = False
+warnings.filterwarnings('ignore', category=InsecureRequestWarning)
+
+# (label, UserPreferenceDogBreed attribute) for each trait shown in a breed's information popup, in display order
+_BREED_TRAIT_LABELS = (
+    ('Affectionate with Family', 'affectionate_w_family'),
+    ('Good with Young Children', 'good_w_young_children'),
+    ('Good with Other Dogs', 'good_w_other_dog'),
+    ('Shedding Level', 'shedding_level'),
+    ('Openness to Strangers', 'openness_to_strangers'),
+    ('Playfullness', 'playfulness'),
+    ('Protective Nature', 'protective_nature'),
+    ('Adaptability', 'adaptability'),
+    ('Trainability', 'trainability'),
+    ('Energy', 'energy'),
+    ('Barking', 'barking'),
+    ('Stimulation Needs', 'stimulation_needs'),
+)
+# Returns all of a breed's trait values for _BREED_TRAIT_LABELS in one call, as a tuple in the same order
+_get_breed_trait_values = operator.attrgetter(*(attribute for _, attribute in _BREED_TRAIT_LABELS))
+
+# Downloaded images are kept in this folder between runs, up to IMAGE_CACHE_MAX_BYTES in total
+IMAGE_CACHE_DIR = 'image_cache'
+IMAGE_CACHE_MAX_BYTES = 50 * 1024 * 1024
+# Held while pruning, so download threads never delete the same files or stat files that were just deleted
+_IMAGE_CACHE_LOCK = threading.Lock()
+
+
+def prune_image_cache() -> None:
+    """Deletes the least recently downloaded images from IMAGE_CACHE_DIR until it fits in IMAGE_CACHE_MAX_BYTES.
+    Files that cannot be inspected or deleted right now are skipped, so pruning never fails a download.
+    """
+    with _IMAGE_CACHE_LOCK:
+        cached_files = []
+        with os.scandir(IMAGE_CACHE_DIR) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.bin'):
+                    continue
+                try:
+                    entry_stat = entry.stat()
+                except OSError:
+                    continue
+                cached_files.append((entry_stat.st_mtime, entry_stat.st_size, entry.path))
+        total_size = sum(size for _, size, _ in cached_files)
+        for _, size, path in sorted(cached_files):
+            if total_size <= IMAGE_CACHE_MAX_BYTES:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue  # e.g. still open in another thread on Windows, it is pruned by a later download
+            total_size -= size
+
+
+def load_image_bytes(url: str) -> bytes:
+    """WARNING: BLOCKING METHOD
+    Returns the raw data of the image at url, downloading it only if it is not in IMAGE_CACHE_DIR yet.
+    """
+    cache_path = os.path.join(IMAGE_CACHE_DIR, hashlib.sha1(url.encode()).hexdigest() + '.bin')
+    try:
+        with open(cache_path, 'rb') as cache_file:
+            return cache_file.read()
+    except FileNotFoundError:
+        pass  # Not downloaded yet, or just pruned by another download thread
+
+    response = _IMAGE_SESSION.get(url, timeout=10)
+    response.raise_for_status()
+    raw_data = response.content
+    os.makedirs(IMAGE_CACHE_DIR, exist_ok=True)
+    # Write to a temporary file first so that other threads never read a partially written image
+    temp_path = f'{cache_path}.{threading.get_ident()}.tmp'
+    with open(temp_path, 'wb') as cache_file:
+        cache_file.write(raw_data)
+    os.replace(temp_path, cache_path)
+    prune_image_cache()
+    return raw_data
+
+
+def fetch_image(url: str, target_image_y_pixel: int) -> Image.Image:
+    """WARNING: BLOCKING METHOD, run it on _IMAGE_POOL
+    Retrieves an image from URL and resizes it to the target height, keeping its aspect ratio.
+    """
+    image_raw = Image.open(io.BytesIO(load_image_bytes(url)))
+    # Lets JPEGs decode straight at a reduced scale that is still larger than the target (no-op for other formats)
+    image_raw.draft('RGB', (target_image_y_pixel * 3, target_image_y_pixel * 3))
+    if image_raw.size[1] >= target_image_y_pixel:
+        # Shrinks in place, so the full size image is not kept in memory next to a resized copy
+        image_raw.thumbnail((image_raw.size[0], target_image_y_pixel), Image.Resampling.BILINEAR)
+        return image_raw
+    y_ratio = target_image_y_pixel / image_raw.size[1]
+    new_x = round(image_raw.size[0] * y_ratio)
+    return image_raw.resize((new_x, target_image_y_pixel), Image.Resampling.BILINEAR)
+
+
+def show_image_when_loaded(image_label: tk.Label, image_future: Future) -> None:
+    """Puts the image from image_future into image_label once it has finished downloading.
+
+    Polls with after() instead of using a done callback, since TK widgets may only be touched
+    from the thread running the TK event loop.
+    """
+    if not image_future.done():
+        image_label.after(50, show_image_when_loaded, image_label, image_future)
+        return
+    try:
+        image = ImageTk.PhotoImage(image_future.result())
+        image_label.configure(image=image, text='')
+        image_label.image = image  # Keep a reference so that TK does not lose the image
+    except (OSError, tk.TclError):  # Download/decoding failures are all OSErrors
+        try:
+            image_label.configure(text='Error finding image')
+        except tk.TclError:
+            pass  # Edge case where the popup was closed before the image loaded
 
 
 class Question:
@@ -40,7 +164,7 @@ class Question:
     def __init__(self, prompt: str) -> None:
         self.prompt = prompt
 
-    def create_widget(self, master: tk.Tk) -> tuple[tk.Widget, Callable[[], str]]:
+    def create_widget(self, master: tk.Misc) -> tuple[tk.Widget, Callable[[], str | int]]:
         """Creates a widget for displaying in TK for this question.
         Returns a tuple that contains the widget object and a callable that can retrieve the
         value inputted into the widget.
@@ -64,15 +188,15 @@ class DropDownQuestion(Question):
     """Represents a drop-down question with multiple options in this questionnaire.
 
     Instance Attributes:
-        - options: List of strings that represent options for this question. The user must pick from these.
+        - options: Strings that represent options for this question. The user must pick from these.
     """
-    options: list[str]
+    options: tuple[str, ...]
 
-    def __init__(self, prompt: str, options: list[str]) -> None:
+    def __init__(self, prompt: str, options: tuple[str, ...]) -> None:
         super().__init__(prompt)
         self.options = options
 
-    def create_widget(self, master: tk.Tk) -> tuple[tk.Widget, Callable[[], str]]:
+    def create_widget(self, master: tk.Misc) -> tuple[tk.Widget, Callable[[], str | int]]:
         variable = tk.StringVar(master)
         variable.set(self.options[0])  # default value, first option
         return tk.OptionMenu(master, variable, *self.options), variable.get
@@ -85,22 +209,35 @@ class NumberQuestion(Question):
         - min_val: Minimum value for this number input
         - max_val: Maximum value for this number input
         - entry: TK box to input into
+        - value: The last valid number entered into entry, as checked by can_update
     """
     min_val: int
     max_val: int
     entry: tk.Entry
+    value: int
 
     def __init__(self, prompt: str, min_val: int, max_val: int) -> None:
         super().__init__(prompt)
         self.min_val = min_val
         self.max_val = max_val
 
-    def create_widget(self, master: tk.Tk) -> tuple[tk.Widget, Callable[[], str]]:
+    def create_widget(self, master: tk.Misc) -> tuple[tk.Widget, Callable[[], str | int]]:
         self.entry = tk.Entry(master)
-        return self.entry, self.entry.get
+        # can_update always runs before the answer is read, so the number it parsed is returned
+        return self.entry, lambda: self.value
 
     def can_update(self) -> bool:
-        return self.entry.get().isdigit() and self.min_val <= int(self.entry.get()) <= self.max_val
+        text = self.entry.get()
+        if not text.isdigit():
+            return False  # Rejects signs, spaces and underscores, which int() would accept
+        try:
+            value = int(text)
+        except ValueError:
+            return False  # Digits such as '²' pass isdigit() but are not numbers
+        if self.min_val <= value <= self.max_val:
+            self.value = value
+            return True
+        return False
 
     def on_display(self) -> None:
         try:
@@ -118,21 +255,26 @@ class Questionnaire(tk.Tk):
     Instance Attributes:
         - questions: List of questions to use
         - current_question_index: Current index of question that we are on
-        - widgets: List of TK widgets that we will propogate the window with
+        - question_frames: TK frame holding each question's widgets, with the callable to get its value,
+            in the same order as questions
+        - rendered_question_index: Index of the question whose widgets are currently shown (-1 if none)
         - answers: User inputted answers from widgets
         - answer_callback: Function to call when user has completed all questions
         - next_button: TK button for moving to next question
         - current_question: Current question and callable for current widget to get its value
+        - fonts: Arial fonts that have been created so far, by size
     """
     questions: list[Question]
     current_question_index: int
-    widgets: list[tk.Widget]
-    answers: list[str]
-    answer_callback: Callable[[list[str]], None]
+    question_frames: list[tuple[tk.Frame, Callable[[], str | int]]]
+    rendered_question_index: int
+    answers: list[str | int]
+    answer_callback: Callable[[list[str | int]], None]
     next_button: tk.Button
-    current_question: tuple[Question, Callable[[], str]]
+    current_question: tuple[Question, Callable[[], str | int]]
+    fonts: dict[int, tkfont.Font]
 
-    def __init__(self, questions: list[Question], answer_callback: Callable[[list[str]], None]) -> None:
+    def __init__(self, questions: list[Question], answer_callback: Callable[[list[str | int]], None]) -> None:
         # Initialize TK superclas
         super().__init__()
         self.title("Questionnaire")
@@ -141,9 +283,11 @@ class Questionnaire(tk.Tk):
         # Initialize questionnaire
         self.questions = questions
         self.current_question_index = 0
-        self.widgets = []
+        self.question_frames = []
+        self.rendered_question_index = -1
         self.answers = []
         self.answer_callback = answer_callback
+        self.fonts = {}
 
         self.setup_ui()
 
@@ -155,42 +299,68 @@ class Questionnaire(tk.Tk):
         """
         self.mainloop()
 
+    def get_font(self, size: int) -> tkfont.Font:
+        """Returns the Arial font with the given size.
+
+        Each size is only created once and then shared by every widget that uses it,
+        so TK does not have to resolve the font again for each new widget.
+        """
+        if size not in self.fonts:
+            self.fonts[size] = tkfont.Font(self, family='Arial', size=size)
+        return self.fonts[size]
+
     def setup_ui(self) -> None:
         """Propogate the master TK with our initial question
         """
         self.next_button = tk.Button(self, text="Next", command=self.next_question)
         self.next_button.pack(side=tk.BOTTOM)
 
+        # Bind the Enter key to the next_question method once, for every question
+        # This assumes all relevant widgets can receive focus.
+        self.bind('<Return>', lambda _: self.next_question())
+
+        # Every question's widgets are created once up front, so moving between questions only re-packs them
+        self.question_frames = [self.create_question_frame(question) for question in self.questions]
         self.update_question()
 
+    def create_question_frame(self, question: Question) -> tuple[tk.Frame, Callable[[], str | int]]:
+        """Creates an unpacked TK frame with the prompt label and widget for the given question.
+        Returns a tuple that contains the frame and a callable that can retrieve the value inputted into the widget.
+        """
+        question_frame = tk.Frame(self)
+
+        # Create and pack the question prompt label
+        prompt_label = tk.Label(question_frame, text=question.prompt, font=self.get_font(14))
+        prompt_label.pack(pady=(10, 5))
+
+        # Create the question widget and get the method to retrieve its value
+        widget, widget_val = question.create_widget(question_frame)
+        widget.pack(pady=(5, 20))
+        return question_frame, widget_val
+
     def clear_widgets(self) -> None:
         """Clear all widgets from the TK UI
+
+        Destroying a question's frame destroys all of the question's widgets with it.
         """
-        for widget in self.widgets:
-            widget.destroy()
-        self.widgets.clear()
+        for question_frame, _ in self.question_frames:
+            question_frame.destroy()
+        self.question_frames.clear()
 
     def update_question(self) -> None:
         """Update the question widgets in the TK UI to represent the current question we are on.
+
+        Does nothing if the widgets already show the current question.
         """
-        self.clear_widgets()
+        if self.rendered_question_index == self.current_question_index:
+            return
+        if 0 <= self.rendered_question_index < len(self.question_frames):
+            self.question_frames[self.rendered_question_index][0].pack_forget()
+        self.rendered_question_index = self.current_question_index
         if self.current_question_index < len(self.questions):
-            question = self.questions[self.current_question_index]
-
-            # Create and pack the question prompt label
-            prompt_label = tk.Label(self, text=question.prompt, font=("Arial", 14))
-            prompt_label.pack(pady=(10, 5))
-            self.widgets.append(prompt_label)
-
-            # Create the question widget and get the method to retrieve its value
-            widget, widget_val = question.create_widget(self)
-            self.current_question = (question, widget_val)
-            widget.pack(pady=(5, 20))
-            self.widgets.append(widget)
-
-            # Bind the Enter key to the next_question method
-            # This assumes all relevant widgets can receive focus.
-            self.bind('<Return>', lambda _: self.next_question())
+            question_frame, widget_val = self.question_frames[self.current_question_index]
+            question_frame.pack()
+            self.current_question = (self.questions[self.current_question_index], widget_val)
         else:
             self.display_results()
 
@@ -208,6 +378,7 @@ class Questionnaire(tk.Tk):
         """
         self.clear_widgets()
         self.next_button.pack_forget()
+        self.unbind('<Return>')  # There are no more questions to move on to
         self.answer_callback(self.answers)
 
 
@@ -226,21 +397,23 @@ def create_preference_questions() -> list[Question]:
         NumberQuestion('High in Trainability? (1-5)', 1, 5),
         NumberQuestion('High in Energy? (1-5)', 1, 5),
         DropDownQuestion('Is high amount of barking/energy considered a positive or negative trait?',
-                         ['positive', 'negative']),
+                         ('positive', 'negative')),
         NumberQuestion('How important is this barking/energy criterion? (1-5)', 1, 5),
         DropDownQuestion('Is needing lots of attention considered a positive or negative trait?',
-                         ['positive', 'negative']),
+                         ('positive', 'negative')),
         NumberQuestion('How important is this stimulation/attention criterion? (1-5)', 1, 5)
     ]
 
 
-def create_demographic_questions(all_districts: set[District]) -> list[Question]:
+def create_demographic_questions(district_names: tuple[str, ...]) -> list[Question]:
     """Creates a set of questions to ask about user demographic.
+
+    district_names are the options for the district question, in the order they should be shown.
     """
     return [
         NumberQuestion('What is your age?', 0, 100),
-        DropDownQuestion('What is your gender?', ['Male', 'Female', 'Other']),
-        DropDownQuestion('What is your district?', sorted([district.district_name for district in all_districts]))
+        DropDownQuestion('What is your gender?', ('Male', 'Female', 'Other')),
+        DropDownQuestion('What is your district?', district_names)
     ]
 
 
@@ -254,16 +427,19 @@ if __name__ == "__main__":
     graph, district_graph = data_loader.load_dog_data('data/zurich_dog_data_2017.csv', district_data)
     district_id_lookup = {district.district_id: district for district in district_data}
     district_name_lookup = {district.district_name: district for district in district_data}
+    sorted_district_names = tuple(sorted(district_name_lookup))
     district_lat_lng = data_loader.load_district_lat_lng('data/district_lat_lng.csv', districts)
 
     breeds = data_loader.dog_breed_data_loader('data/breed_traits.csv')
+    breed_by_name = {breed.breed_name: breed for breed in breeds}
     dog_translations = data_loader.load_translation_mapping('data/translated_dog_breed.csv')
     dog_images = data_loader.load_dog_images('data/dog_images.csv')
 
     # Create questions
     recommendation_limit = 5
+    breed_image_height = 250
 
-    demographic_questions = create_demographic_questions(district_data)
+    demographic_questions = create_demographic_questions(sorted_district_names)
     preference_questions = create_preference_questions()
 
     all_questions = demographic_questions + preference_questions
@@ -279,7 +455,7 @@ if __name__ == "__main__":
         min_val = data[-1][1]
         max_val = data[0][1]
         diff = 1 - max_val
-        power = math.log(1 - target_diff_percent, min_val)
+        power = math.log1p(-target_diff_percent) / math.log(min_val)
         return [(entry[0], ((entry[1] + diff) ** power) - diff) for entry in data]
 
     def add_frame(parent: tk.Misc) -> tk.Frame:
@@ -292,7 +468,7 @@ if __name__ == "__main__":
     def add_label_to_frame(parent: tk.Frame, column: int, text: str, font_size: int = 14) -> None:
         """Add a label (plaintext) to a TK frame in the given column with the given label and font size
         """
-        label = tk.Label(parent, text=text, font=("Arial", font_size))
+        label = tk.Label(parent, text=text, font=app.get_font(font_size))
         label.pack(padx=(5, 5), pady=(10, 5))
         label.grid(row=0, column=column)
 
@@ -300,7 +476,7 @@ if __name__ == "__main__":
                             command: Callable[[], None], font_size: int = 14) -> None:
         """Add a button to a TK frame in the given column with the given function callable, text label and font size
         """
-        button = tk.Button(parent, text=text, command=command, font=("Arial", font_size))
+        button = tk.Button(parent, text=text, command=command, font=app.get_font(font_size))
         button.grid(row=0, column=column)
 
     def create_map_popup(dog_breed: str, limit: int) -> None:
@@ -316,20 +492,20 @@ if __name__ == "__main__":
             index += 1
         zurich_map.create_map_overlay(f'Top Zurich District Choices for {dog_breed}', top_district_pins)
 
-    def get_image_from_url(url: str, target_image_y_pixel: int) -> PhotoImage:
-        """WARNING: BLOCKING METHOD
-        Retrieves an image from URL then loads it into an ImageTk
+    image_futures: dict[str, Future] = {}
+
+    def request_breed_image(english_dog_breed: str) -> Future:
+        """Starts downloading the image of the given dog breed in the background, unless it is already
+        being (or has been) downloaded. Returns the future that holds the resized image.
+
+        Preconditions:
+            - english_dog_breed in dog_images
         """
-        ctx = ssl.create_default_context()
-        ctx.check_hostname = False
-        ctx.verify_mode = ssl.CERT_NONE
-        with urllib.request.urlopen(url, context=ctx) as get:
-            raw_data = get.read()
-        image_raw = Image.open(io.BytesIO(raw_data))
-        y_ratio = target_image_y_pixel / image_raw.size[1]
-        new_x = round(image_raw.size[0] * y_ratio)
-        resized = image_raw.resize((new_x, target_image_y_pixel))
-        return ImageTk.PhotoImage(resized)
+        image_future = image_futures.get(english_dog_breed)
+        if image_future is None or (image_future.done() and image_future.exception() is not None):
+            image_future = _IMAGE_POOL.submit(fetch_image, dog_images[english_dog_breed], breed_image_height)
+            image_futures[english_dog_breed] = image_future
+        return image_future
 
     def create_breed_info_popup(english_dog_breed: str) -> None:
         """Creates and displays a Tkinter window with an image of the dog breed and other relevant information.
@@ -339,54 +515,35 @@ if __name__ == "__main__":
         popup.title(f'{english_dog_breed} Information')
         popup.resizable(False, False)
         frame = add_frame(popup)
-        tk.Label(popup, text=f'{english_dog_breed} Information', font=('Arial', 20)).pack(pady=(10, 5))
+        tk.Label(popup, text=f'{english_dog_breed} Information', font=app.get_font(20)).pack(pady=(10, 5))
         if english_dog_breed in dog_images:
-            try:
-                image_url = dog_images[english_dog_breed]
-                image: PhotoImage = get_image_from_url(image_url, 250)
-                tk.Label(frame, image=image).pack(pady=(5, 10))
-            except (HTTPError, tk.TclError):
-                tk.Label(popup, text='Error finding image').pack(pady=(5, 10))
+            image_label = tk.Label(frame, text='Loading image...')
+            image_label.pack(pady=(5, 10))
+            show_image_when_loaded(image_label, request_breed_image(english_dog_breed))
         else:
             tk.Label(popup, text='Error finding image').pack(pady=(5, 10))
-        breed: Optional[data_loader.UserPreferenceDogBreed] = None
-        for target in breeds:
-            if target.breed_name == english_dog_breed:
-                breed = target
-                break
+        breed: Optional[data_loader.UserPreferenceDogBreed] = breed_by_name.get(english_dog_breed)
         if breed is None:
             tk.Label(popup,
                      text='Information about this breed is not available! (Working on it)',
-                     font=('Arial', 14)
+                     font=app.get_font(14)
                      ).pack(pady=(5, 10))
         else:
-            def trait_label(text: str) -> None:
-                """Adds a dog trait label to the popup with the given text
-                """
-                tk.Label(popup, text=text, font=('Arial', 11)).pack(pady=(1, 1))
-            trait_label(f'Affectionate with Family: {breed.affectionate_w_family}')
-            trait_label(f'Good with Young Children: {breed.good_w_young_children}')
-            trait_label(f'Good with Other Dogs: {breed.good_w_other_dog}')
-            trait_label(f'Shedding Level: {breed.shedding_level}')
-            trait_label(f'Openness to Strangers: {breed.openness_to_strangers}')
-            trait_label(f'Playfullness: {breed.playfulness}')
-            trait_label(f'Protective Nature: {breed.protective_nature}')
-            trait_label(f'Adaptability: {breed.adaptability}')
-            trait_label(f'Trainability: {breed.trainability}')
-            trait_label(f'Energy: {breed.energy}')
-            trait_label(f'Barking: {breed.barking}')
-            trait_label(f'Stimulation Needs: {breed.stimulation_needs}')
-        popup.mainloop()
-
-    def process_answers(answers: list[str]) -> None:
+            trait_font = app.get_font(11)
+            for (title, _), value in zip(_BREED_TRAIT_LABELS, _get_breed_trait_values(breed)):
+                tk.Label(popup, text=f'{title}: {value}', font=trait_font).pack(pady=(1, 1))
+
+    def process_answers(answers: list[str | int]) -> None:
         """Processes the answers that are inputted by the user.
+
+        Answers to number questions are already ints, and answers to drop-down questions are strs.
         """
         demographic_answers = answers[:len(demographic_questions)]
         preference_answers = answers[len(demographic_questions):]
 
         input_user = User(
             -1,
-            int(demographic_answers[0]),
+            demographic_answers[0],
             demographic_answers[1][:1].upper(),
             district_name_lookup[demographic_answers[2]]
         )
@@ -396,11 +553,7 @@ if __name__ == "__main__":
             graph,
         )
 
-        casted_preference_answers: list[str | int] = [
-            int(answer) if answer.isdigit() else answer for answer in preference_answers
-        ]
-
-        weighted_preferences = user_preference.weight_raw_preference_data(*casted_preference_answers)
+        weighted_preferences = user_preference.weight_raw_preference_data(*preference_answers)
         preference_recommendations = (
             user_preference.get_preference_recommendations(breeds, recommendation_limit, *weighted_preferences))
         preference_recommendations = (
@@ -410,10 +563,18 @@ if __name__ == "__main__":
         demographic_recommendations = curve_data(0.5, demographic_recommendations)
         preference_recommendations = curve_data(0.15, preference_recommendations)
 
+        # Start downloading the recommended breeds' images now, so that they are usually
+        # already cached by the time the user opens a breed's information popup
+        recommended_breeds = ([dog_translations[rec[0]] for rec in demographic_recommendations]
+                              + [rec[0] for rec in preference_recommendations])
+        for breed_name in recommended_breeds:
+            if breed_name in dog_images:
+                request_breed_image(breed_name)
+
         def add_dog_breed_entry(english_dog_breed: str, german_dog_breed: Optional[str], percent_match: float) -> None:
             """Adds a dog breed entry to our TKinter window with the top districts and dog info buttons.
             """
-            score_percent = int(round(percent_match * 10000) / 100)
+            score_percent = round(percent_match * 10000) // 100  # Whole percent, after rounding to 2 decimals
             frame = add_frame(app)
             add_label_to_frame(frame, 0, f'{english_dog_breed}: {score_percent}% match', font_size=11)
             if german_dog_breed is not None:
@@ -427,7 +588,7 @@ if __name__ == "__main__":
         def add_large_label(message: str) -> None:
             """Adds a large padded text label to the tkinter window with given message
             """
-            label = tk.Label(app, text=message, font=("Arial", 14))
+            label = tk.Label(app, text=message, font=app.get_font(14))
             label.pack(pady=(10, 5))
 
         add_large_label('Dog Breed Recommendations Based on your Demographic:')
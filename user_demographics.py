@@ -4,7 +4,11 @@ File for processing user demographic information and generating recommendations.
 
 Does not load data from files itself, just contains logic for calculating recommendations.
 """
+import heapq
+import operator
+
 import data_loader
+from districts import District
 from graphs import Graph
 from userdata import User
 
@@ -14,24 +18,25 @@ def get_demographic_recommendations(input_user: User, limit: int, dog_graph: Gra
 
     Returns a list of tuples that contain the name of the dog breed [0] and the score it got [1] from 0.0 to 1.0.
     """
-    dog_breeds = {node for node in dog_graph.get_all_nodes() if not isinstance(node, User)}
+    dog_breeds = dog_graph.get_all_nodes('breed')
     dog_breed_score = {}
+    # Owners with the same age, gender and district are equally similar to input_user,
+    # so each distinct profile is only compared once (there are far fewer profiles than owners)
+    profile_similarity: dict[tuple[int, str, District], float] = {}
     for dog_breed in dog_breeds:
         user_owners: set[User] = dog_graph.get_neighbours(dog_breed)
+        total_similarity = 0.0
+        for target in user_owners:
+            profile = (target.age, target.gender, target.district)
+            similarity = profile_similarity.get(profile)
+            if similarity is None:
+                similarity = target.compare(input_user)
+                profile_similarity[profile] = similarity
+            total_similarity += similarity
         # +7 and +10 makes it so that greater average is given to dogs with more samples
-        average_similarity = (sum([target.compare(input_user) for target in user_owners]) + 7) / (len(user_owners) + 10)
+        average_similarity = (total_similarity + 7) / (len(user_owners) + 10)
         dog_breed_score[dog_breed] = average_similarity
-    top_matches = []
-    while len(top_matches) < limit:
-        max_score = -1
-        max_breed = ''
-        for dog_breed in dog_breed_score:
-            if dog_breed_score[dog_breed] > max_score:
-                max_score = dog_breed_score[dog_breed]
-                max_breed = dog_breed
-        top_matches.append((max_breed, dog_breed_score[max_breed]))
-        dog_breed_score.pop(max_breed)
-    return top_matches
+    return heapq.nlargest(limit, dog_breed_score.items(), key=operator.itemgetter(1))
 
 
 if __name__ == '__main__':
@@ -6,7 +6,8 @@ A decision matrix that takes user's preferences based on criterias
 decided by the American Kennel Club.
 Did data cleaning to delete the irrelevant columns/criterias from CSV file.
 """
-import math
+import heapq
+import operator
 
 from data_loader import UserPreferenceDogBreed, dog_breed_data_loader
 
@@ -45,8 +46,7 @@ def get_preference_recommendations(dog_breeds: list[UserPreferenceDogBreed],
             wbarking * dog_breed.barking + \
             wstimulation_needs * dog_breed.stimulation_needs
         breed_scores.append((dog_breed.breed_name, breed_score))
-        breed_scores.sort(key=lambda key: key[1], reverse=True)
-    return breed_scores[:limit]
+    return heapq.nlargest(limit, breed_scores, key=operator.itemgetter(1))
 
 
 def weight_raw_preference_data(affectionate_w_family: int,
@@ -86,21 +86,15 @@ def normalize_preference_recommendations(scores: list[tuple[str, int]]) -> list[
     """Turns raw dog breed recommendations (with scores that are uncapped) into normalized (0.0 to 1.0).
     scores is a list of dog breeds where the first part of the tuple is the name and the second part is the score.
     """
-    normal_scores = []
-    min_score = math.inf
-    max_score = -math.inf
-    for score in scores:
-        if score[1] < min_score:
-            min_score = score[1]
-        if score[1] > max_score:
-            max_score = score[1]
+    if not scores:
+        return []
+    raw_scores = [score[1] for score in scores]
+    min_score = min(raw_scores)
+    max_score = max(raw_scores)
     max_score += (max_score - min_score)
     min_score = max_score - (max_score - min_score) * 2
-    for score in scores:
-        normalized = score[1] - min_score
-        normalized /= max_score - min_score
-        normal_scores.append((score[0], normalized))
-    return normal_scores
+    score_range = max_score - min_score
+    return [(score[0], (score[1] - min_score) / score_range) for score in scores]
 
 
 if __name__ == '__main__':
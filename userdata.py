@@ -5,6 +5,7 @@ Class that is used to compare how similar one user is to another user.
 Does not load data, primarily used for calculating user similarity though.
 """
 from __future__ import annotations
+from functools import lru_cache
 from districts import District
 
 
@@ -38,13 +39,21 @@ class User:
         Preconditions:
             - other.user_id != self.user_id
         """
-        age_diff = abs(other.age - self.age)
-        age_score = (-0.0001 * (age_diff ** 2)) + 1  # Plot -0.0001x^2+1 in desmos
-        assert 0.0 <= age_score <= 1.0
-        gender_score = 1.0 if self.gender in [other.gender, 'o'] else 0.5
-        assert 0.0 <= gender_score <= 1.0
-        district_score = self.district.get_distance(other.district)
-        assert 0.0 <= district_score <= 1.0
-        score = 0.4 * age_score + 0.2 * gender_score + 0.4 * district_score
-        assert 0.0 <= score <= 1.0
-        return score
+        return compare_profiles(self.age, self.gender, self.district, other.age, other.gender, other.district)
+
+
+@lru_cache(maxsize=8192)
+def compare_profiles(age: int, gender: str, district: District,
+                     other_age: int, other_gender: str, other_district: District) -> float:
+    """Gives a numerical score from 0.0 to 1.0 on how similar a user with the first age, gender and district
+    is to a user with the other age, gender and district. See User.compare.
+
+    Many dog owners share the same age range, gender and district, so scores are cached by those values.
+    District distances must be set before comparing, since cached scores are not updated if they change.
+    """
+    age_diff = abs(other_age - age)
+    age_score = (-0.0001 * (age_diff ** 2)) + 1  # Plot -0.0001x^2+1 in desmos
+    gender_score = 1.0 if gender == other_gender or gender == 'o' else 0.5
+    district_score = district.get_distance(other_district)
+    score = 0.4 * age_score + 0.2 * gender_score + 0.4 * district_score
+    return score
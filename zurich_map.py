@@ -43,7 +43,7 @@ def write_district_locations(api_key: str, districts: set[District], csv_path: s
 def create_map_overlay(title: str, pins: set[tuple[float, float, str]]) -> None:
     """Creates a TKinter window that display a map of Zurich with the set of pins displayed in it.
 
-    Each pin is a tuple with the longitude, latitude, and title.
+    Each pin is a tuple with the latitude, longitude, and title.
     Immediately displays it to the user, runs non-blocking.
     """
     master = tk.Toplevel()
@@ -54,8 +54,8 @@ def create_map_overlay(title: str, pins: set[tuple[float, float, str]]) -> None:
     map_view.pack(fill='both')
     map_view.set_position(47.3769, 8.5417)  # Centered on Zurich
     map_view.set_zoom(12)
-    for pin in pins:
-        map_view.set_marker(pin[0], pin[1], pin[2])
+    for lat, lng, pin_title in pins:
+        map_view.set_marker(lat, lng, pin_title)
 
 
 def get_top_districts(dog_breed: str, districts: set[District], district_graph: WeightedGraph) -> list[District]: